@@ -1,27 +1,329 @@
 import os
-import urllib.request as request
+import shutil
+import contextlib
+import subprocess
+import tempfile
+import threading
 import zipfile
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
 from MLOps import logger
+
+try:
+    from stream_unzip import stream_unzip
+except ImportError:
+    stream_unzip = None
+
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+try:
+    import libarchive
+except (ImportError, OSError, AttributeError):
+    # libarchive-c raises OSError/AttributeError when the system libarchive is missing
+    libarchive = None
+
 from MLOps.utils.common import get_size
 from MLOps.entity.config_entity import DataIngestionConfig
-from MLOps.utils.common import create_directories,get_size
+from MLOps.utils.common import create_directories,get_size,load_json,save_json
+
+_zipfile_get_decompressor = zipfile._get_decompressor
+_zipfile_crc32 = zipfile.crc32
+_isal_users = 0
+_isal_lock = threading.Lock()
+
+
+def _get_isal_decompressor(compress_type):
+    if compress_type == zipfile.ZIP_DEFLATED:
+        return isal_zlib.decompressobj(-15)
+    return _zipfile_get_decompressor(compress_type)
+
+
+@contextlib.contextmanager
+def _isal_zip_reading():
+    """
+    Route zipfile's inflate and crc32 through ISA-L for the duration of an extraction.
+    Compressors are left on stdlib zlib, since ISA-L only accepts compression levels 0-3.
+    """
+    global _isal_users
+    if isal_zlib is None:
+        yield
+        return
+    with _isal_lock:
+        if _isal_users == 0:
+            zipfile._get_decompressor = _get_isal_decompressor
+            zipfile.crc32 = isal_zlib.crc32
+        _isal_users += 1
+    try:
+        yield
+    finally:
+        with _isal_lock:
+            _isal_users -= 1
+            if _isal_users == 0:
+                zipfile._get_decompressor = _zipfile_get_decompressor
+                zipfile.crc32 = _zipfile_crc32
+
 
 class DataIngestion:
     def __init__(self, config: DataIngestionConfig):
         self.config = config
         create_directories([self.config.root_dir])
     
+    def _validators_file(self) -> Path:
+        return Path(f"{self.config.local_data_file}.meta.json")
+    
+    def _is_up_to_date(self) -> bool:
+        # Probe with a HEAD request so an unchanged dataset costs a round trip, not a transfer
+        validators_file = self._validators_file()
+        if not validators_file.exists():
+            return True
+        validators = load_json(validators_file)
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        try:
+            response = requests.head(self.config.source_URL, headers=headers, timeout=10, allow_redirects=True)
+        except requests.RequestException as e:
+            logger.warning(f"Could not check {self.config.source_URL} for updates, using cached file: {e}")
+            return True
+        if response.status_code == 304:
+            return True
+        etag = response.headers.get("ETag")
+        if etag:
+            return etag == validators.get("etag")
+        last_modified = response.headers.get("Last-Modified")
+        return bool(last_modified) and last_modified == validators.get("last_modified")
+    
+    def _download_with_requests(self, part_file: str) -> dict:
+        # Validators of the in-progress download, so a resume can tell whether the file changed
+        part_validators_file = Path(f"{part_file}.meta.json")
+        resume_from = os.path.getsize(part_file) if os.path.exists(part_file) else 0
+        part_validators = load_json(part_validators_file) if resume_from and part_validators_file.exists() else {}
+        if_range = part_validators.get("etag") or part_validators.get("last_modified")
+        # identity encoding keeps Range offsets in the same bytes that are written to disk
+        headers = {"Accept-Encoding": "identity"}
+        if resume_from and if_range:
+            headers["Range"] = f"bytes={resume_from}-"
+            # With If-Range the server sends the full body instead if the file changed meanwhile
+            headers["If-Range"] = if_range
+        elif resume_from:
+            logger.info(f"No validators stored for {part_file}, restarting the download")
+        with requests.get(self.config.source_URL, stream=True, headers=headers, timeout=60) as response:
+            if response.status_code == 416 and "Range" in headers:
+                # The part file is already complete if we stopped right before renaming it
+                total = response.headers.get("Content-Range", "").rpartition("/")[2]
+                if total == str(resume_from):
+                    return part_validators
+                logger.info(f"Server rejected resuming {part_file}, restarting the download")
+                os.remove(part_file)
+                return self._download_with_requests(part_file)
+            response.raise_for_status()
+            response.raw.decode_content = True
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified")
+            }
+            # Servers that ignore Range, or whose file changed, reply 200 with the full body
+            if "Range" in headers and response.status_code == 206:
+                logger.info(f"Resuming download from byte {resume_from}")
+                mode = 'ab'
+            else:
+                mode = 'wb'
+                save_json(part_validators_file, validators)
+            with open(part_file, mode) as f:
+                shutil.copyfileobj(response.raw, f, length=64 * 1024)
+        return validators
+    
+    def _download_with_aria2c(self, aria2c: str, part_file: str) -> dict:
+        # aria2c pulls 8 byte ranges over parallel connections and resumes partial files itself
+        subprocess.run(
+            [aria2c, "-x", "8", "-s", "8", "--continue=true", "--allow-overwrite=true",
+             "-d", os.path.dirname(part_file) or ".", "-o", os.path.basename(part_file),
+             self.config.source_URL],
+            check=True
+        )
+        try:
+            response = requests.head(self.config.source_URL, timeout=10, allow_redirects=True)
+        except requests.RequestException as e:
+            logger.warning(f"Could not fetch validators for {self.config.source_URL}: {e}")
+            return {"etag": None, "last_modified": None}
+        return {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
+    
     def download_file(self):
-        if not os.path.exists(self.config.local_data_file):
-            logger.info(f"Downloading file from {self.config.source_URL} to {self.config.local_data_file}")
-            request.urlretrieve(self.config.source_URL, self.config.local_data_file)
-            logger.info(f"Downloaded {get_size(self.config.local_data_file)} bytes")
-        else:
+        if os.path.exists(self.config.local_data_file) and self._is_up_to_date():
             logger.info(f"File already exists at {self.config.local_data_file}")
+            return
+        logger.info(f"Downloading file from {self.config.source_URL} to {self.config.local_data_file}")
+        part_file = f"{self.config.local_data_file}.part"
+        aria2c = shutil.which("aria2c") if self.config.parallel_download else None
+        if aria2c:
+            validators = self._download_with_aria2c(aria2c, part_file)
+        else:
+            if self.config.parallel_download:
+                logger.warning("parallel_download is enabled but aria2c was not found, using a single stream")
+            validators = self._download_with_requests(part_file)
+        os.replace(part_file, self.config.local_data_file)
+        Path(f"{part_file}.meta.json").unlink(missing_ok=True)
+        save_json(self._validators_file(), validators)
+        logger.info(f"Downloaded {get_size(self.config.local_data_file)} bytes")
+    
+    def _member_target(self, member):
+        # None for names such as '/' or '..' that sanitise to nothing
+        name = self._sanitize_member_name(member.filename)
+        if not name:
+            return None
+        return os.path.join(self.config.unzip_dir, name)
+    
+    def _write_member(self, zip_ref, member, target):
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        try:
+            fd = os.open(target, flags, 0o666)
+        except FileNotFoundError:
+            # Parents are normally created up front; exist_ok keeps concurrent workers from racing
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            fd = os.open(target, flags, 0o666)
+        with os.fdopen(fd, 'wb') as dest:
+            # Reserve the full size up front so the filesystem need not grow the file chunk by chunk
+            if member.file_size and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fd, 0, member.file_size)
+                except OSError:
+                    pass
+            with zip_ref.open(member) as source:
+                shutil.copyfileobj(source, dest, 64 * 1024)
+    
+    def _extract_members(self, members):
+        # Each worker opens its own handle; a single ZipFile is not safe to share across threads
+        with zipfile.ZipFile(self.config.local_data_file, 'r') as zip_ref:
+            for member in members:
+                target = self._member_target(member)
+                if target is not None:
+                    self._write_member(zip_ref, member, target)
+    
+    def _create_member_dirs(self, members):
+        # Create every parent directory once up front so workers neither repeat nor race on mkdir
+        dirs = set()
+        for member in members:
+            target = self._member_target(member)
+            if target is not None:
+                dirs.add(target if member.is_dir() else os.path.dirname(target))
+        for directory in sorted(dirs):
+            os.makedirs(directory, exist_ok=True)
+    
+    @staticmethod
+    def _sanitize_member_name(name: str) -> str:
+        # Same rules as zipfile: drop the drive, leading separators and '.'/'..' components
+        name = os.path.splitdrive(name.replace('\\', '/'))[1]
+        return '/'.join(part for part in name.split('/') if part not in ('', '.', '..'))
+    
+    def _rooted_entries(self, archive, unzip_dir: str):
+        for entry in archive:
+            name = self._sanitize_member_name(entry.pathname)
+            if not name:
+                continue
+            if entry.issym:
+                # A symlink could point later stages at arbitrary host files, so never create one
+                logger.warning(f"Skipping symlink {entry.pathname} -> {entry.linkpath}")
+                continue
+            entry.pathname = os.path.join(unzip_dir, name)
+            if entry.islnk:
+                # Hard link targets are archive paths as well and must stay inside unzip_dir
+                target = self._sanitize_member_name(entry.linkpath)
+                if not target:
+                    continue
+                entry.linkpath = os.path.join(unzip_dir, target)
+            yield entry
+    
+    def _extract_with_libarchive(self):
+        # libarchive parses and inflates in C. Entries are re-rooted under unzip_dir rather than
+        # chdir'ing the whole process, so the absolute-path check of PREVENT_ESCAPE is replaced
+        # by the sanitising in _rooted_entries while the '..' and symlink checks stay on.
+        unzip_dir = os.path.abspath(self.config.unzip_dir)
+        os.makedirs(unzip_dir, exist_ok=True)
+        flags = (libarchive.extract.EXTRACT_TIME
+                 | (libarchive.extract.PREVENT_ESCAPE & ~libarchive.extract.EXTRACT_SECURE_NOABSOLUTEPATHS))
+        with libarchive.file_reader(os.fspath(self.config.local_data_file)) as archive:
+            libarchive.extract.extract_entries(self._rooted_entries(archive, unzip_dir), flags=flags)
     
     def extract_zip_file(self):
         logger.info(f"Extracting zip file to {self.config.unzip_dir}")
+        if libarchive is not None:
+            self._extract_with_libarchive()
+            logger.info("Extraction completed")
+            return
         with zipfile.ZipFile(self.config.local_data_file, 'r') as zip_ref:
-            zip_ref.extractall(self.config.unzip_dir)
+            members = zip_ref.infolist()
+        self._create_member_dirs(members)
+        members = [member for member in members if not member.is_dir()]
+        if members:
+            workers = min(len(members), os.cpu_count() or 1)
+            batches = [members[i::workers] for i in range(workers)]
+            with _isal_zip_reading(), ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self._extract_members, batches))
         logger.info("Extraction completed")
-        
\ No newline at end of file
+    
+    def _make_staging_dir(self) -> str:
+        # Prefer tmpfs so extraction reads the archive from RAM, but only if it is known to fit
+        shm_dir = "/dev/shm"
+        if os.path.isdir(shm_dir) and os.access(shm_dir, os.W_OK):
+            try:
+                response = requests.head(self.config.source_URL, timeout=10, allow_redirects=True)
+                size = int(response.headers.get("Content-Length", 0))
+            except (requests.RequestException, ValueError):
+                size = 0
+            if 0 < size < shutil.disk_usage(shm_dir).free:
+                return tempfile.mkdtemp(dir=shm_dir)
+        return tempfile.mkdtemp()
+    
+    def _download_and_extract_staged(self):
+        staging_dir = self._make_staging_dir()
+        logger.info(f"Staging archive in {staging_dir}")
+        try:
+            staged_file = Path(staging_dir) / Path(self.config.local_data_file).name
+            staged = DataIngestion(replace(self.config, local_data_file=staged_file))
+            staged.download_file()
+            staged.extract_zip_file()
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    @staticmethod
+    def _decode_member_name(name: bytes) -> str:
+        # Like zipfile: names without the UTF-8 flag are cp437, which stream-unzip does not expose
+        try:
+            return name.decode('utf-8')
+        except UnicodeDecodeError:
+            return name.decode('cp437')
+    
+    def download_and_extract(self):
+        if stream_unzip is None:
+            logger.warning("stream-unzip is not installed, staging the archive in a temporary directory")
+            self._download_and_extract_staged()
+            return
+        # Unzip straight from the HTTP response so the archive never touches disk
+        logger.info(f"Streaming {self.config.source_URL} into {self.config.unzip_dir}")
+        unzip_dir = Path(self.config.unzip_dir).resolve()
+        with requests.get(self.config.source_URL, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            for name, _, chunks in stream_unzip(response.iter_content(64 * 1024)):
+                out_path = (unzip_dir / self._decode_member_name(name)).resolve()
+                if not out_path.is_relative_to(unzip_dir):
+                    raise ValueError(f"Refusing to extract {name!r} outside {unzip_dir}")
+                if name.endswith(b'/'):
+                    out_path.mkdir(parents=True, exist_ok=True)
+                    for _ in chunks:
+                        pass
+                    continue
+                out_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(out_path, 'wb') as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+        logger.info("Extraction completed")
\ No newline at end of file
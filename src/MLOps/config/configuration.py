@@ -1,13 +1,19 @@
 from MLOps.constants import *
-from MLOps.utils.common import read_yaml, create_directories
+from MLOps.utils.common import read_yaml, load_config, create_directories
+from functools import lru_cache
 from MLOps.entity.config_entity import DataIngestionConfig
 
+
+@lru_cache(maxsize=None)
+def _load_config_files(config_file_path, params_file_path, schema_file_path):
+    # Every stage builds its own ConfigurationManager; load each set of files once per process
+    return load_config(config_file_path), read_yaml(params_file_path), read_yaml(schema_file_path)
+
+
 class ConfigurationManager:
     def __init__(self, config_file_path=CONFIG_FILE_PATH, params_file_path=PARAMS_FILE_PATH, schema_file_path=SCHEMA_FILE_PATH):
         
-        self.config = read_yaml(config_file_path)
-        self.params = read_yaml(params_file_path)
-        self.schema = read_yaml(schema_file_path)
+        self.config, self.params, self.schema = _load_config_files(config_file_path, params_file_path, schema_file_path)
         create_directories(list_of_directories=[self.config.artifacts_root])
     
     def get_data_ingestion_config(self) -> DataIngestionConfig:
@@ -15,7 +21,9 @@ class ConfigurationManager:
         create_directories([data_ingestion_config.root_dir])
         return DataIngestionConfig(
             root_dir=data_ingestion_config.root_dir,
-            source_URL=data_ingestion_config.source_URL,
+            source_URL=data_ingestion_config.source_url,
             local_data_file=data_ingestion_config.local_data_file,
-            unzip_dir=data_ingestion_config.unzip_dir
+            unzip_dir=data_ingestion_config.unzip_dir,
+            parallel_download=data_ingestion_config.parallel_download,
+            stream_extract=data_ingestion_config.stream_extract
         )
\ No newline at end of file
@@ -1,5 +1,8 @@
 from pathlib import Path
 
+__all__ = ["CONFIG_FILE_PATH", "PARAMS_FILE_PATH", "SCHEMA_FILE_PATH", "YAML_CACHE_SUBDIR"]
+
 CONFIG_FILE_PATH = Path("config/config.yaml")
 PARAMS_FILE_PATH = Path("params.yaml")
-SCHEMA_FILE_PATH = Path("schema.yaml")
\ No newline at end of file
+SCHEMA_FILE_PATH = Path("schema.yaml")
+YAML_CACHE_SUBDIR = Path("mlops/yaml")
\ No newline at end of file
@@ -1,9 +1,46 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Dict
 
 @dataclass(frozen=True)
 class DataIngestionConfig:
     root_dir: Path
     source_URL: str
     local_data_file: Path
-    unzip_dir: Path
\ No newline at end of file
+    unzip_dir: Path
+    parallel_download: bool = False
+    stream_extract: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class DataIngestionSection:
+    root_dir: Path
+    source_url: str
+    local_data_file: Path
+    unzip_dir: Path
+    parallel_download: bool = False
+    stream_extract: bool = False
+
+    @classmethod
+    def from_dict(cls, content: Dict[str, Any]) -> "DataIngestionSection":
+        return cls(
+            root_dir=Path(content["root_dir"]),
+            source_url=content["source_url"],
+            local_data_file=Path(content["local_data_file"]),
+            unzip_dir=Path(content["unzip_dir"]),
+            parallel_download=bool(content.get("parallel_download", False)),
+            stream_extract=bool(content.get("stream_extract", False))
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class AppConfig:
+    artifacts_root: Path
+    data_ingestion: DataIngestionSection
+
+    @classmethod
+    def from_dict(cls, content: Dict[str, Any]) -> "AppConfig":
+        return cls(
+            artifacts_root=Path(content["artifacts_root"]),
+            data_ingestion=DataIngestionSection.from_dict(content["data_ingestion"])
+        )
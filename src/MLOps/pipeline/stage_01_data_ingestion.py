@@ -9,7 +9,10 @@ class DataIngestionPipeline:
 
     def run(self):
         try:
-            self.data_ingestion.download_file()
-            self.data_ingestion.extract_zip_file()
+            if self.data_ingestion_config.stream_extract:
+                self.data_ingestion.download_and_extract()
+            else:
+                self.data_ingestion.download_file()
+                self.data_ingestion.extract_zip_file()
         except Exception as e:
             raise e
\ No newline at end of file
@@ -2,12 +2,115 @@ import os
 import sys
 import yaml
 import json
-import joblib
+import pickle
+import hashlib
+import stat
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Union, Dict, List
-from ensure import ensure_annotations
+from typing import Any, Callable, Optional, Union, Dict, List
 from box import ConfigBox
 from box.exceptions import BoxValueError
+from MLOps import logger
+from MLOps.constants import YAML_CACHE_SUBDIR
+from MLOps.entity.config_entity import AppConfig
+
+# Runtime annotation checks are opt-in (MLOPS_VALIDATE=1); by default the decorator is a no-op
+if os.environ.get("MLOPS_VALIDATE") == "1":
+    from ensure import ensure_annotations
+else:
+    def ensure_annotations(f):
+        return f
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Parsed YAML files keyed by (path, mtime_ns, size, builder) so unchanged files are not re-read
+_YAML_CACHE: Dict[tuple, Any] = {}
+_YAML_CACHE_LOCK = threading.Lock()
+
+
+def _is_trusted_cache(st: os.stat_result) -> bool:
+    # Only unpickle files owned by the current user that nobody else can write to
+    if not hasattr(os, "getuid"):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _yaml_cache_dir() -> Optional[Path]:
+    # Resolved per call: Path.home() raises in containers without HOME or a passwd entry
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        try:
+            cache_home = Path.home() / ".cache"
+        except (RuntimeError, KeyError):
+            return None
+    return Path(cache_home) / YAML_CACHE_SUBDIR
+
+
+def _parse_yaml_with_pickle_cache(path_to_yaml: Path) -> Any:
+    """
+    Parse a YAML file, keeping a pickle of the result in the per-user cache directory
+    keyed by the file's absolute path and a hash of its contents, so later runs skip
+    YAML parsing entirely.
+    """
+    with open(path_to_yaml, 'rb') as yaml_file:
+        raw = yaml_file.read()
+    cache_dir = _yaml_cache_dir()
+    if cache_dir is None:
+        return yaml.load(raw.decode('utf-8'), Loader=_YamlLoader)
+    abs_path = os.path.abspath(path_to_yaml)
+    prefix = f"{Path(abs_path).stem}.{hashlib.blake2b(abs_path.encode(), digest_size=8).hexdigest()}"
+    digest = hashlib.blake2b(raw, digest_size=8).hexdigest()
+    cache_file = cache_dir / f"{prefix}.{digest}.pkl"
+    try:
+        with open(cache_file, 'rb') as f:
+            if _is_trusted_cache(os.stat(cache_dir)) and _is_trusted_cache(os.fstat(f.fileno())):
+                return pickle.load(f)
+            logger.warning(f"Ignoring YAML cache {cache_file}: not owned by the current user or writable by others")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable YAML cache {cache_file}: {e}")
+    content = yaml.load(raw.decode('utf-8'), Loader=_YamlLoader)
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not _is_trusted_cache(os.stat(cache_dir)):
+            return content
+        fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(content, f, protocol=5)
+        os.replace(tmp_file, cache_file)
+        # Drop pickles of earlier versions of the same file
+        for stale_file in cache_dir.glob(f"{prefix}.*.pkl"):
+            if stale_file != cache_file:
+                stale_file.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not write YAML cache {cache_file}: {e}")
+    return content
+
+
+def _load_yaml_cached(path_to_yaml: Path, build: Callable[[Any], Any]) -> Any:
+    """
+    Parse a YAML file and convert it with `build`, reusing the cached result
+    while the file's modification time and size are unchanged.
+    """
+    st = os.stat(path_to_yaml)
+    key = (str(path_to_yaml), st.st_mtime_ns, st.st_size, build)
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(key)
+    if cached is not None:
+        return cached
+    content = _parse_yaml_with_pickle_cache(path_to_yaml)
+    if content is None:
+        raise ValueError(f"YAML file '{path_to_yaml}' is empty")
+    result = build(content)
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[key] = result
+    return result
 
 
 @ensure_annotations
@@ -15,6 +118,9 @@ def read_yaml(path_to_yaml: Path) -> ConfigBox:
     """
     Read YAML file and return its contents as a ConfigBox object.
     
+    Results are cached by path, modification time and size, so repeated
+    reads of an unchanged file return the same ConfigBox instance.
+    
     Args:
         path_to_yaml (Path): Path to the YAML file
         
@@ -31,11 +137,7 @@ def read_yaml(path_to_yaml: Path) -> ConfigBox:
         >>> print(config.data_ingestion.source_url)
     """
     try:
-        with open(path_to_yaml, 'r', encoding='utf-8') as yaml_file:
-            content = yaml.safe_load(yaml_file)
-            if content is None:
-                raise ValueError(f"YAML file '{path_to_yaml}' is empty")
-            return ConfigBox(content)
+        return _load_yaml_cached(path_to_yaml, ConfigBox)
     except FileNotFoundError:
         raise FileNotFoundError(f"YAML file not found: {path_to_yaml}")
     except yaml.YAMLError as e:
@@ -45,7 +147,37 @@ def read_yaml(path_to_yaml: Path) -> ConfigBox:
 
 
 @ensure_annotations
-def load_json(path_to_json: Path) -> Dict[str, Any]:
+def load_config(path_to_yaml: Path) -> AppConfig:
+    """
+    Read the pipeline config YAML straight into typed, frozen dataclasses.
+    
+    Args:
+        path_to_yaml (Path): Path to the config YAML file
+        
+    Returns:
+        AppConfig: Parsed configuration tree
+        
+    Raises:
+        ValueError: If the YAML file is empty or a required key is missing
+        FileNotFoundError: If the YAML file does not exist
+        yaml.YAMLError: If there's an error parsing the YAML file
+        
+    Examples:
+        >>> config = load_config(Path("config/config.yaml"))
+        >>> print(config.data_ingestion.source_url)
+    """
+    try:
+        return _load_yaml_cached(path_to_yaml, AppConfig.from_dict)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"YAML file not found: {path_to_yaml}")
+    except yaml.YAMLError as e:
+        raise yaml.YAMLError(f"Error parsing YAML file '{path_to_yaml}': {e}")
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid config in '{path_to_yaml}': missing or malformed key {e}")
+
+
+@ensure_annotations
+def load_json(path_to_json: Path) -> dict:
     """
     Load JSON file and return its contents as a dictionary.
     
@@ -53,7 +185,7 @@ def load_json(path_to_json: Path) -> Dict[str, Any]:
         path_to_json (Path): Path to the JSON file
         
     Returns:
-        Dict[str, Any]: Contents of the JSON file as a dictionary
+        dict: Contents of the JSON file as a dictionary
         
     Raises:
         FileNotFoundError: If the JSON file does not exist
@@ -81,7 +213,7 @@ def create_directory(path_to_directory: Union[Path, str], verbose: bool = True)
     
     Args:
         path_to_directory (Union[Path, str]): Path to the directory to create
-        verbose (bool, optional): Whether to print creation message. Defaults to True.
+        verbose (bool, optional): Whether to log creation message. Defaults to True.
         
     Examples:
         >>> create_directory("artifacts/data_ingestion")
@@ -92,19 +224,19 @@ def create_directory(path_to_directory: Union[Path, str], verbose: bool = True)
     if not path_to_directory.exists():
         path_to_directory.mkdir(parents=True, exist_ok=True)
         if verbose:
-            print(f"Created directory: {path_to_directory}")
+            logger.debug(f"Created directory: {path_to_directory}")
     elif verbose:
-        print(f"Directory already exists: {path_to_directory}")
+        logger.debug(f"Directory already exists: {path_to_directory}")
 
 
-@ensure_annotations
-def save_json(path_to_json: Path, data: Dict[str, Any], indent: int = 4) -> None:
+# @ensure_annotations
+def save_json(path_to_json: Path, data: dict, indent: int = 4) -> None:
     """
     Save dictionary as JSON file.
     
     Args:
         path_to_json (Path): Path where the JSON file will be saved
-        data (Dict[str, Any]): Dictionary data to save
+        data (dict): Dictionary data to save
         indent (int, optional): Number of spaces for indentation. Defaults to 4.
         
     Raises:
@@ -121,14 +253,14 @@ def save_json(path_to_json: Path, data: Dict[str, Any], indent: int = 4) -> None
         
         with open(path_to_json, 'w', encoding='utf-8') as json_file:
             json.dump(data, json_file, indent=indent, ensure_ascii=False)
-        print(f"JSON data saved to: {path_to_json}")
+        logger.debug(f"JSON data saved to: {path_to_json}")
     except TypeError as e:
         raise TypeError(f"Data is not JSON serializable: {e}")
     except PermissionError:
         raise PermissionError(f"Permission denied: Cannot write to {path_to_json}")
 
 
-@ensure_annotations
+# @ensure_annotations
 def save_bin(data: Any, path_to_bin: Path) -> None:
     """
     Save data as binary file using joblib.
@@ -151,15 +283,17 @@ def save_bin(data: Any, path_to_bin: Path) -> None:
         # Create directory if it doesn't exist
         create_directory(path_to_bin.parent, verbose=False)
         
+        # joblib pulls in numpy, so import it only when binaries are actually used
+        import joblib
         joblib.dump(value=data, filename=path_to_bin)
-        print(f"Binary data saved to: {path_to_bin}")
+        logger.debug(f"Binary data saved to: {path_to_bin}")
     except PermissionError:
         raise PermissionError(f"Permission denied: Cannot write to {path_to_bin}")
     except Exception as e:
         raise Exception(f"Error saving binary data to {path_to_bin}: {e}")
 
 
-@ensure_annotations
+# @ensure_annotations
 def load_bin(path_to_bin: Path) -> Any:
     """
     Load data from binary file using joblib.
@@ -181,8 +315,9 @@ def load_bin(path_to_bin: Path) -> Any:
         >>> print(array.shape)
     """
     try:
+        import joblib
         data = joblib.load(path_to_bin)
-        print(f"Binary data loaded from: {path_to_bin}")
+        logger.debug(f"Binary data loaded from: {path_to_bin}")
         return data
     except FileNotFoundError:
         raise FileNotFoundError(f"Binary file not found: {path_to_bin}")
@@ -190,6 +325,26 @@ def load_bin(path_to_bin: Path) -> Any:
         raise Exception(f"Error loading binary data from {path_to_bin}: {e}")
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+def _walk_size(root: Union[str, Path]) -> int:
+    """
+    Sum the sizes of all files under `root` using os.scandir, whose DirEntry
+    objects reuse the type and stat data already returned by the directory read.
+    """
+    total = 0
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
 @ensure_annotations
 def get_size(path: Union[str|Path]) -> str:
     """
@@ -219,19 +374,11 @@ def get_size(path: Union[str|Path]) -> str:
         size_bytes = path.stat().st_size
     else:
         # Calculate directory size
-        size_bytes = sum(
-            file.stat().st_size 
-            for file in path.rglob('*') 
-            if file.is_file()
-        )
-    
-    # Convert bytes to human-readable format
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
+        size_bytes = _walk_size(path)
     
-    return f"{size_bytes:.2f} PB"
+    # Convert bytes to human-readable format; each unit spans 10 bits
+    idx = min(len(_SIZE_UNITS) - 1, max(0, (int(size_bytes).bit_length() - 1) // 10))
+    return f"{size_bytes / (1 << (10 * idx)):.2f} {_SIZE_UNITS[idx]}"
 
 
 # Additional utility functions for common MLOps tasks
@@ -261,12 +408,15 @@ def create_directories(list_of_directories: List[Union[Path, str]], verbose: boo
     
     Args:
         list_of_directories (List[Union[Path, str]]): List of directory paths to create
-        verbose (bool, optional): Whether to print creation messages. Defaults to True.
+        verbose (bool, optional): Whether to log creation messages. Defaults to True.
         
     Examples:
         >>> dirs = ["artifacts/data_ingestion", "artifacts/model_training", "logs"]
         >>> create_directories(dirs)
     """
-    print('Creating files')
+    logger.debug('Creating files')
+    # makedirs(exist_ok=True) is idempotent, so skip the exists() probe and Path wrapping
     for directory in list_of_directories:
-        create_directory(directory, verbose=verbose)
\ No newline at end of file
+        os.makedirs(os.fspath(directory), exist_ok=True)
+        if verbose:
+            logger.debug(f"Ensured directory: {directory}")
\ No newline at end of file
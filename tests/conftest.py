@@ -0,0 +1,85 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class DatasetServer:
+    """Serves one file with ETag/Last-Modified validators and byte-range support."""
+
+    def __init__(self):
+        self.data = b""
+        self.etag = '"v1"'
+        self.last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+        self.honour_if_modified_since = True
+        self.requests = []
+        self.url = None
+
+    def set_data(self, data, etag=None, last_modified=None):
+        self.data = data
+        if etag is not None:
+            self.etag = etag
+        if last_modified is not None:
+            self.last_modified = last_modified
+
+
+def _make_handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body=b"", extra_headers=None):
+            self.send_response(status)
+            if server.etag:
+                self.send_header("ETag", server.etag)
+            if server.last_modified:
+                self.send_header("Last-Modified", server.last_modified)
+            for name, value in (extra_headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        def _not_modified(self):
+            if_none_match = self.headers.get("If-None-Match")
+            if if_none_match is not None:
+                return bool(server.etag) and if_none_match == server.etag
+            if_modified_since = self.headers.get("If-Modified-Since")
+            return (server.honour_if_modified_since and if_modified_since is not None
+                    and if_modified_since == server.last_modified)
+
+        def do_HEAD(self):
+            server.requests.append((self.command, dict(self.headers)))
+            if self._not_modified():
+                self._send(304)
+            else:
+                self._send(200, server.data)
+
+        def do_GET(self):
+            server.requests.append((self.command, dict(self.headers)))
+            data = server.data
+            range_header = self.headers.get("Range")
+            if_range = self.headers.get("If-Range")
+            if range_header and if_range in (None, server.etag, server.last_modified):
+                start = int(range_header.split("=")[1].split("-")[0])
+                if start >= len(data):
+                    self._send(416, extra_headers={"Content-Range": f"bytes */{len(data)}"})
+                    return
+                self._send(206, data[start:], {"Content-Range": f"bytes {start}-{len(data) - 1}/{len(data)}"})
+                return
+            self._send(200, data)
+
+    return Handler
+
+
+@pytest.fixture
+def dataset_server():
+    server = DatasetServer()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(server))
+    server.url = f"http://127.0.0.1:{httpd.server_address[1]}/data.zip"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    httpd.shutdown()
+    httpd.server_close()
@@ -0,0 +1,49 @@
+import os
+import pickle
+
+import pytest
+
+from MLOps.utils import common
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(common, "_yaml_cache_dir", lambda: cache_dir)
+    return cache_dir
+
+
+def test_pickle_cache_replaces_stale_entries(tmp_path, cache_dir):
+    yaml_file = tmp_path / "params.yaml"
+    yaml_file.write_text("alpha: 0.1\n")
+    assert common._parse_yaml_with_pickle_cache(yaml_file) == {"alpha": 0.1}
+    yaml_file.write_text("alpha: 0.2\n")
+    assert common._parse_yaml_with_pickle_cache(yaml_file) == {"alpha": 0.2}
+
+    cached = list(cache_dir.glob("params.*.pkl"))
+    assert len(cached) == 1
+    assert pickle.loads(cached[0].read_bytes()) == {"alpha": 0.2}
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="ownership checks are POSIX only")
+def test_pickle_cache_ignores_files_writable_by_others(tmp_path, cache_dir):
+    yaml_file = tmp_path / "params.yaml"
+    yaml_file.write_text("alpha: 0.1\n")
+    common._parse_yaml_with_pickle_cache(yaml_file)
+    (cache_file,) = cache_dir.glob("params.*.pkl")
+    cache_file.write_bytes(pickle.dumps({"alpha": "tampered"}))
+    os.chmod(cache_file, 0o666)
+
+    assert common._parse_yaml_with_pickle_cache(yaml_file) == {"alpha": 0.1}
+
+
+def test_pickle_cache_is_skipped_without_home_directory(tmp_path, monkeypatch):
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(common.Path, "home", staticmethod(no_home))
+    yaml_file = tmp_path / "params.yaml"
+    yaml_file.write_text("alpha: 0.1\n")
+
+    assert common._yaml_cache_dir() is None
+    assert common._parse_yaml_with_pickle_cache(yaml_file) == {"alpha": 0.1}
@@ -0,0 +1,99 @@
+import os
+import stat
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from MLOps.components import data_ingestion
+from MLOps.components.data_ingestion import DataIngestion
+from MLOps.entity.config_entity import DataIngestionConfig
+
+
+def _extract(tmp_path, members, symlinks=None):
+    archive = tmp_path / "data.zip"
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(zipfile.ZipInfo(name), data)
+        for name, target in (symlinks or {}).items():
+            info = zipfile.ZipInfo(name)
+            info.create_system = 3  # unix, so the mode bits below are honoured
+            info.external_attr = (stat.S_IFLNK | 0o777) << 16
+            zf.writestr(info, target)
+    unzip_dir = tmp_path / "unzipped"
+    config = DataIngestionConfig(
+        root_dir=tmp_path,
+        source_URL="http://localhost/data.zip",
+        local_data_file=archive,
+        unzip_dir=unzip_dir
+    )
+    DataIngestion(config).extract_zip_file()
+    return unzip_dir
+
+
+@pytest.fixture(params=["libarchive", "zipfile"])
+def backend(request, monkeypatch):
+    if request.param == "libarchive":
+        if data_ingestion.libarchive is None:
+            pytest.skip("libarchive is not available")
+    else:
+        monkeypatch.setattr(data_ingestion, "libarchive", None)
+    return request.param
+
+
+def test_extract_zip_file_writes_members(tmp_path, backend):
+    unzip_dir = _extract(tmp_path, {"winequality.csv": "a,b\n1,2\n", "nested/dir/file.txt": "x" * 5000})
+
+    assert (unzip_dir / "winequality.csv").read_text() == "a,b\n1,2\n"
+    assert (unzip_dir / "nested/dir/file.txt").read_text() == "x" * 5000
+
+
+def test_extract_zip_file_keeps_absolute_member_inside_unzip_dir(tmp_path, backend):
+    escaped = tmp_path / "escaped.txt"
+    unzip_dir = _extract(tmp_path, {str(escaped): "outside"})
+
+    assert not escaped.exists()
+    assert (unzip_dir / Path(*escaped.parts[1:])).read_text() == "outside"
+
+
+def test_extract_zip_file_does_not_create_symlinks(tmp_path, backend):
+    unzip_dir = _extract(tmp_path, {"other.csv": "a,b"}, symlinks={"winequality-red.csv": "/etc/passwd"})
+
+    assert not (unzip_dir / "winequality-red.csv").is_symlink()
+    assert (unzip_dir / "other.csv").read_text() == "a,b"
+
+
+def test_extract_zip_file_leaves_zip_writing_on_stdlib_zlib(tmp_path, backend):
+    _extract(tmp_path, {"file.txt": "data"})
+
+    with zipfile.ZipFile(tmp_path / "out.zip", 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        zf.writestr("file.txt", "data" * 100)
+    with zipfile.ZipFile(tmp_path / "out.zip") as zf:
+        assert zf.read("file.txt") == b"data" * 100
+
+
+def test_extract_zip_file_sanitises_absolute_and_dotdot_members(tmp_path, backend, monkeypatch):
+    # Several workers, so members sharing a parent directory land in different batches
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    unzip_dir = _extract(tmp_path, {
+        "/abs/a.txt": "a",
+        "/abs/b.txt": "b",
+        "../up/c.txt": "c",
+        "empty/": ""
+    })
+
+    assert (unzip_dir / "abs/a.txt").read_text() == "a"
+    assert (unzip_dir / "abs/b.txt").read_text() == "b"
+    assert (unzip_dir / "up/c.txt").read_text() == "c"
+    assert (unzip_dir / "empty").is_dir()
+    assert not (tmp_path / "up").exists()
+
+
+def test_extract_members_creates_missing_parents(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_ingestion, "libarchive", None)
+    monkeypatch.setattr(DataIngestion, "_create_member_dirs", lambda self, members: None)
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+
+    unzip_dir = _extract(tmp_path, {f"shared/new/f{i}.txt": str(i) for i in range(8)})
+
+    assert sorted(p.name for p in (unzip_dir / "shared/new").iterdir()) == [f"f{i}.txt" for i in range(8)]
@@ -0,0 +1,140 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+from MLOps.components import data_ingestion
+from MLOps.components.data_ingestion import DataIngestion
+from MLOps.entity.config_entity import DataIngestionConfig
+
+
+@pytest.fixture
+def ingestion(tmp_path, dataset_server):
+    config = DataIngestionConfig(
+        root_dir=tmp_path,
+        source_URL=dataset_server.url,
+        local_data_file=tmp_path / "data.zip",
+        unzip_dir=tmp_path
+    )
+    return DataIngestion(config)
+
+
+def _write_part(ingestion, data, etag):
+    part_file = f"{ingestion.config.local_data_file}.part"
+    with open(part_file, 'wb') as f:
+        f.write(data)
+    with open(f"{part_file}.meta.json", 'w') as f:
+        json.dump({"etag": etag, "last_modified": None}, f)
+
+
+def test_download_file_writes_archive_and_validators(ingestion, dataset_server):
+    dataset_server.set_data(b"dataset" * 1000)
+
+    ingestion.download_file()
+
+    assert ingestion.config.local_data_file.read_bytes() == b"dataset" * 1000
+    with open(f"{ingestion.config.local_data_file}.meta.json") as f:
+        assert json.load(f)["etag"] == dataset_server.etag
+
+
+def test_download_file_resumes_partial_download_with_if_range(ingestion, dataset_server):
+    data = bytes(range(256)) * 100
+    dataset_server.set_data(data)
+    _write_part(ingestion, data[:1000], dataset_server.etag)
+
+    ingestion.download_file()
+
+    assert ingestion.config.local_data_file.read_bytes() == data
+    _, headers = dataset_server.requests[-1]
+    assert headers["Range"] == "bytes=1000-"
+    assert headers["If-Range"] == dataset_server.etag
+    assert headers["Accept-Encoding"] == "identity"
+
+
+def test_download_file_keeps_complete_part_file_on_416(ingestion, dataset_server):
+    data = b"complete" * 100
+    dataset_server.set_data(data)
+    _write_part(ingestion, data, dataset_server.etag)
+
+    ingestion.download_file()
+
+    assert ingestion.config.local_data_file.read_bytes() == data
+
+
+def test_download_file_restarts_when_dataset_changed(ingestion, dataset_server):
+    dataset_server.set_data(b"new" * 1000, etag='"v2"')
+    _write_part(ingestion, b"old" * 100, '"v1"')
+
+    ingestion.download_file()
+
+    assert ingestion.config.local_data_file.read_bytes() == b"new" * 1000
+
+
+def test_download_file_skips_unchanged_dataset_on_304(ingestion, dataset_server):
+    dataset_server.set_data(b"dataset" * 100)
+    ingestion.download_file()
+    dataset_server.requests.clear()
+
+    ingestion.download_file()
+
+    assert [method for method, _ in dataset_server.requests] == ["HEAD"]
+
+
+def test_download_file_falls_back_to_last_modified_without_etag(ingestion, dataset_server):
+    dataset_server.etag = None
+    dataset_server.honour_if_modified_since = False
+    dataset_server.set_data(b"dataset" * 100)
+    ingestion.download_file()
+    dataset_server.requests.clear()
+
+    ingestion.download_file()
+
+    assert [method for method, _ in dataset_server.requests] == ["HEAD"]
+
+
+def test_download_file_refreshes_changed_dataset(ingestion, dataset_server):
+    dataset_server.set_data(b"old" * 100)
+    ingestion.download_file()
+    dataset_server.set_data(b"new" * 100, etag='"v2"', last_modified="Tue, 02 Jan 2024 00:00:00 GMT")
+
+    ingestion.download_file()
+
+    assert ingestion.config.local_data_file.read_bytes() == b"new" * 100
+
+
+class _Cp437ZipInfo(zipfile.ZipInfo):
+    # Writes the name as cp437 without the UTF-8 flag, as legacy zip tools do
+    __slots__ = ()
+
+    def _encodeFilenameFlags(self):
+        return self.filename.encode('cp437'), self.flag_bits
+
+
+def _zip_bytes(members, info_class=zipfile.ZipInfo):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(info_class(name), data)
+    return buffer.getvalue()
+
+
+@pytest.mark.skipif(data_ingestion.stream_unzip is None, reason="stream-unzip is not available")
+def test_download_and_extract_streams_members(ingestion, dataset_server):
+    dataset_server.set_data(_zip_bytes({"winequality.csv": "a,b\n1,2\n", "nested/file.txt": "x" * 5000}))
+
+    ingestion.download_and_extract()
+
+    unzip_dir = ingestion.config.unzip_dir
+    assert (unzip_dir / "winequality.csv").read_text() == "a,b\n1,2\n"
+    assert (unzip_dir / "nested/file.txt").read_text() == "x" * 5000
+    assert not ingestion.config.local_data_file.exists()
+
+
+@pytest.mark.skipif(data_ingestion.stream_unzip is None, reason="stream-unzip is not available")
+def test_download_and_extract_decodes_cp437_names(ingestion, dataset_server):
+    dataset_server.set_data(_zip_bytes({"café.txt": "data"}, _Cp437ZipInfo))
+
+    ingestion.download_and_extract()
+
+    assert (ingestion.config.unzip_dir / "café.txt").read_text() == "data"
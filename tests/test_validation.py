@@ -0,0 +1,48 @@
+import io
+import os
+import subprocess
+import sys
+import zipfile
+
+SCRIPT = """
+import sys
+from pathlib import Path
+from MLOps.components.data_ingestion import DataIngestion
+from MLOps.entity.config_entity import DataIngestionConfig
+from MLOps.utils import common
+
+assert common.ensure_annotations.__module__ != common.__name__, "validation is not enabled"
+root = Path(sys.argv[1])
+common.save_json(root / "data.json", {"a": 1})
+assert common.load_json(root / "data.json") == {"a": 1}
+common.save_bin([1, 2], root / "data.joblib")
+assert common.load_bin(root / "data.joblib") == [1, 2]
+config = DataIngestionConfig(
+    root_dir=root,
+    source_URL=sys.argv[2],
+    local_data_file=root / "data.zip",
+    unzip_dir=root / "unzipped"
+)
+ingestion = DataIngestion(config)
+ingestion.download_file()
+ingestion.download_file()
+ingestion.extract_zip_file()
+assert (root / "unzipped" / "winequality.csv").read_text() == "a,b"
+"""
+
+
+def test_ingestion_runs_with_annotation_checks_enabled(tmp_path, dataset_server):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("winequality.csv", "a,b")
+    dataset_server.set_data(buffer.getvalue())
+
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, str(tmp_path), dataset_server.url],
+        cwd=tmp_path,
+        env={**os.environ, "MLOPS_VALIDATE": "1"},
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0, result.stderr